@@ -0,0 +1,1251 @@
+"""CNC API Client Core for RosettaCNC & derivated NC Systems Benchmark."""
+#-------------------------------------------------------------------------------
+# Name:         cnc_api_client_core_benchmark
+#
+# Purpose:      CNC API Client Core for RosettaCNC & derivated NC Systems Benchmark
+#
+# Note          Compatible with API server version 1.5.3
+#               1 (on 1.x.y) means interface contract
+#               x (on 1.x.y) means version
+#               y (on 1.x.y) means release
+#
+# Note          Checked with Python 3.11.9
+#
+# Note          The benchmarks run against a local stand-in API server which answers
+#               with recorded responses, so no RosettaCNC Control Software is needed.
+#               Measures are related to the client side costs (syscalls, copies,
+#               decoding) and to the number of round trips, not to the real server.
+#
+# Author:       support@rosettacnc.com
+#
+# Created:      17/10/2026
+# Copyright:    RosettaCNC (c) 2016-2026
+# Licence:      RosettaCNC License 1.0 (RCNC-1.0)
+# Coding Style  https://www.python.org/dev/peps/pep-0008/
+#-------------------------------------------------------------------------------
+# pylint: disable=C0103 -> invalid-name
+# pylint: disable=C0116 -> missing-function-docstring
+# pylint: disable=C0301 -> line-too-long
+# pylint: disable=W0718 -> broad-exception-caught           ## take care when you use that ##
+#-------------------------------------------------------------------------------
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import json
+import math
+import random
+import time
+import socket
+import tempfile
+import tracemalloc
+import threading
+
+from functools import partial
+
+import cnc_api_client_core as api
+
+# == BEG: recorded responses
+#
+
+def _axes(value: float) -> list:
+    return [round(value + i * 0.125, 3) for i in range(6)]
+
+RESPONSES = {
+    'axes.info': {
+        'joint.position': _axes(10.0),
+        'machine.position': _axes(10.0),
+        'program.position': _axes(5.0),
+        'machine.target.position': _axes(10.0),
+        'program.target.position': _axes(5.0),
+        'actual.velocity': _axes(0.0),
+        'working.wcs': 1,
+        'working.offset': _axes(5.0),
+        'dynamic.offset': [0.0, 0.0, 0.0],
+        'homing.done': True,
+        'homing.done.mask': 7,
+        'homing.running.mask': 0,
+        'homing.sensors.mask': 0,
+        'homing.correction.space': _axes(0.0),
+    },
+    'cnc.info': {
+        'units.mode': api.UM_METRIC,
+        'axes.mask': api.X2Z_AXIS_MASK,
+        'state.machine': api.SM_IDLE,
+        'gcode.line': 0,
+        'planned.time': '00:12:34',
+        'worked.time': '00:00:00',
+        'hud.user.message': '',
+        'operator.request.id.pending': '',
+        'current.alarm': {'datetime': 133000000000000000, 'code': 0, 'info1': 0, 'info2': 0, 'text': ''},
+        'current.warning': {'datetime': 133000000000000000, 'code': 0, 'info1': 0, 'info2': 0, 'text': ''},
+        'aux.outputs': 0,
+        'coolant': {'mist': False, 'flood': False},
+        'lube': {
+            'axis.cycles.made': 12, 'axis.time.to.next.cycle': 3600,
+            'spindle.cycles.made': 4, 'spindle.time.to.next.cycle': 1800,
+        },
+        'feed': {'programmed': 1000.0, 'target': 1000.0, 'reference': 0.0},
+        'spindle': {
+            'programmed': 12000, 'target': 0, 'actual': 0, 'load': 0, 'torque': 0,
+            'phase': api.SP_STOPPED, 'direction': api.SD_STOPPED, 'not.ready': False,
+            'shaft': api.ST_STOPPED, 'status': api.SS_TOOL_HOLDER_BLOCKED_CORRECTLY, 'voltage': 0,
+        },
+        'override': {
+            f'{name}{suffix}': value
+            for name in ['jog', 'spindle', 'fast', 'feed', 'feed.custom.1', 'feed.custom.2', 'plasma.power', 'plasma.voltage']
+            for suffix, value in [('', 100), ('.min', 0), ('.max', 120), ('.enabled', True), ('.locked', False)]
+        },
+        'tool': {
+            'id': 1, 'slot': 1, 'slot.enabled': True, 'type': api.TT_FLAT_END_MILL, 'diameter': 6.0,
+            'offset.x': 0.0, 'offset.y': 0.0, 'offset.z': 42.5,
+            'param.1': 0.0, 'param.2': 0.0, 'param.3': 0.0, 'description': 'flat end mill 6 mm',
+        },
+    },
+    'compile.info': {
+        'code': 0, 'code.line': 0, 'file.line': 0, 'file.name': 'program.ngc', 'message': '', 'state': api.CS_READY,
+    },
+    'enabled.commands': {
+        name: False
+        for name in [
+            'cnc.csfm.cooler.flood', 'cnc.csfm.cooler.mist', 'cnc.csfm.jog.mode', 'cnc.csfm.spindle.cw',
+            'cnc.csfm.spindle.ccw', 'cnc.csfm.thc.disabled', 'cnc.csfm.torch', 'cnc.connection.close',
+            'cnc.connection.open', 'cnc.continue', 'cnc.mdi.command', 'cnc.parameters', 'cnc.pause', 'cnc.resume',
+            'cnc.resume.from.line', 'cnc.resume.from.point', 'cnc.start', 'cnc.start.from.line',
+            'cnc.start.from.point', 'cnc.stop', 'program.analysis', 'program.analysis.abort',
+            'program.gcode.add.text', 'program.gcode.clear', 'program.gcode.set.text', 'program.load',
+            'program.new', 'program.save', 'program.save.as', 'reset.alarms', 'reset.alarms.history',
+            'reset.warnings', 'reset.warnings.history', 'set.kinematics', 'show.ui.dialog', 'tools.lib.write',
+        ]
+    } | {'cnc.csfm.aux': 0, 'cnc.homing': 0, 'cnc.jog.command': 0, 'set.program.position': 0},
+    'coordinate.systems.info': {
+        'working.wcs': 1,
+        'working.offset': [0.0] * 6,
+    } | {f'wcs.{i}': [float(i), 0.0, 0.0, 0.0, 0.0, 0.0] for i in range(1, 10)},
+    'localization.info': {
+        'units.mode': api.UM_METRIC,
+        'locale.name': 'en',
+        'description': 'English',
+        'list': [
+            {'locale.name': name, 'description': description, 'owner': 'CNC', 'revisor': 'CNC', 'version': '1.0',
+             'date': '2026-01-01', 'program': 'CNC Control Software'}
+            for name, description in [('en', 'English'), ('it', 'Italiano'), ('de', 'Deutsch'), ('fr', 'Francais')]
+        ],
+    },
+    'system.info': {
+        'machine.name': 'Stand-in CNC',
+        'control.software.version': '1.5.3',
+        'core.version': '1.5.3',
+        'api.server.version': '1.5.3',
+        'firmware.version': '2.1.0',
+        'firmware.version.tag': 'release',
+        'firmware.interface.level': 12,
+        'order.code': 'SI-0001',
+        'customer.id': 'SI',
+        'serial.number': '000001',
+        'part.number': 'PN-0001',
+        'customization.number': 'CN-0001',
+        'hardware.version': 'HW-1',
+        'operative.system': 'Linux',
+        'operative.system.crc': '00000000',
+        'pld.version': 'PLD-1',
+        'licensed.feature': {
+            'panel.pc': True, 'panel.pc.demo': False, 'work.orders': True, 'opc.ua.server': False,
+            'probe.sdk.g1': False, 'probe.sdk.g2': False, 'probe.sdk.g3': False, 'probe.sdk.g4': False,
+            'probe.sdk.g5': False,
+        },
+    },
+}
+
+#
+# == END: recorded responses
+
+# == BEG: stand-in API server
+#
+
+class StandInServer:
+    """Local stand-in API server answering a recorded response for every request."""
+
+    def __init__(self, responses: dict = None, delay: float = 0.0):
+        self.responses = {}
+        for name, res in (responses or RESPONSES).items():
+            self.responses[name] = (json.dumps({'res': res}, separators=(',', ':')) + '\n').encode()
+        self.default_response = b'{"res":true}\n'
+        self.delay = delay
+        self.tools = []
+        self.program = None
+        self.parameters = [0.0] * api.CNC_PARAMETERS_COUNT
+        self.parameters_descriptions = [''] * api.CNC_PARAMETERS_COUNT
+        self.requests = 0
+        self.port = 0
+        self.__socket = None
+
+    def start(self) -> StandInServer:
+        """Starts the server on a free localhost port."""
+        self.__socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.__socket.bind(('127.0.0.1', 0))
+        self.__socket.listen(1024)
+        self.port = self.__socket.getsockname()[1]
+        threading.Thread(target=self.__accept_loop, daemon=True).start()
+        return self
+
+    def stop(self):
+        """Stops the server."""
+        try:
+            self.__socket.close()
+        except Exception:
+            pass
+
+    def __accept_loop(self):
+        while True:
+            try:
+                connection, _ = self.__socket.accept()
+            except Exception:
+                return
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self.__client_loop, args=(connection,), daemon=True).start()
+
+    def __client_loop(self, connection: socket.socket):
+        buffer = bytearray()
+        with connection:
+            while True:
+                try:
+                    chunk = connection.recv(65536)
+                except Exception:
+                    return
+                if not chunk:
+                    return
+                buffer += chunk
+                if b'\n' not in chunk:
+                    continue
+                *lines, rest = buffer.split(b'\n')
+                buffer = bytearray(rest)
+                answers = []
+                for line in lines:
+                    if line.strip():
+                        answers.append(self.__answer(line))
+                if answers:
+                    if self.delay:
+                        time.sleep(self.delay)
+                    connection.sendall(b''.join(answers))
+
+    def __answer(self, line: bytes) -> bytes:
+        self.requests += 1
+        request = json.loads(line)
+        name = request.get('get') or request.get('cmd') or request.get('set')
+        if name.startswith('tools.lib.'):
+            return (json.dumps({'res': self.__answer_tools_lib(name, request)}, separators=(',', ':')) + '\n').encode()
+        if name == 'cnc.parameters':
+            return (json.dumps({'res': self.__answer_parameters(request)}, separators=(',', ':')) + '\n').encode()
+        if name.startswith('program.gcode.') or (name == 'program.info' and self.program is not None):
+            return (json.dumps({'res': self.__answer_program(name, request)}, separators=(',', ':')) + '\n').encode()
+        return self.responses.get(name, self.default_response)
+
+    def __answer_program(self, name: str, request: dict):
+        # the program is kept as list of added texts, to not copy it at every add
+        if name == 'program.gcode.set.text':
+            self.program = [request['text']]
+        elif name == 'program.gcode.add.text' and self.program is not None:
+            self.program.append(request['text'])
+        elif name == 'program.gcode.clear':
+            self.program = []
+        elif name == 'program.info':
+            return {'file.name': '', 'code': ''.join(self.program)}
+        else:
+            return False
+        return True
+
+    def __answer_parameters(self, request: dict):
+        address = request['address']
+        if 'get' in request:
+            stop = address + request['elements']
+            if not 0 <= address < stop <= len(self.parameters):
+                return False
+            return {'values': self.parameters[address:stop], 'descriptions': self.parameters_descriptions[address:stop]}
+        for key, target in [('values', self.parameters), ('descriptions', self.parameters_descriptions)]:
+            if key in request:
+                if not 0 <= address <= address + len(request[key]) <= len(target):
+                    return False
+                target[address:address + len(request[key])] = request[key]
+        return True
+
+    def __answer_tools_lib(self, name: str, request: dict):
+        fields = {key: value for key, value in request.items() if key not in ('get', 'cmd', 'set', 'index')}
+        index = request.get('index')
+        if name == 'tools.lib.infos':
+            return {'slot.enabled': True, 'tools': [dict(tool, index=i) for i, tool in enumerate(self.tools)]}
+        if name == 'tools.lib.count':
+            return {'count': len(self.tools)}
+        if name == 'tools.lib.info' and 'get' in request:
+            return dict(self.tools[index], index=index) if 0 <= index < len(self.tools) else False
+        if name == 'tools.lib.tool.index.from.id':
+            return {'index': next((i for i, tool in enumerate(self.tools) if tool['id'] == request['id']), -1)}
+        if name == 'tools.lib.clear':
+            self.tools.clear()
+        elif name == 'tools.lib.add':
+            self.tools.append(new_tool(**fields))
+        elif name == 'tools.lib.insert' and 0 <= index <= len(self.tools):
+            self.tools.insert(index, new_tool(**fields))
+        elif name == 'tools.lib.delete' and 0 <= index < len(self.tools):
+            del self.tools[index]
+        elif name == 'tools.lib.info' and 0 <= index < len(self.tools):
+            self.tools[index].update(fields)
+        else:
+            return False
+        return True
+
+class StandInDirectAccess:
+    """Local stand-in cnc_direct_access module answering a recorded response for every request."""
+
+    def __init__(self, responses: dict = None):
+        self.responses = {name: {'res': res} for name, res in (responses or RESPONSES).items()}
+        self.text_responses = {name: json.dumps(response, separators=(',', ':')) for name, response in self.responses.items()}
+        self.default_response = {'res': True}
+        self.requests = 0
+
+    def api_server_request(self, request: str) -> str:
+        """Answers a request as JSON text, like the module versions without structured requests."""
+        self.requests += 1
+        request = json.loads(request)
+        name = request.get('get') or request.get('cmd') or request.get('set')
+        return self.text_responses.get(name, '{"res":true}')
+
+    def api_server_request_object(self, request: dict) -> dict:
+        """Answers a request as dict object."""
+        self.requests += 1
+        name = request.get('get') or request.get('cmd') or request.get('set')
+        return self.responses.get(name, self.default_response)
+
+#
+# == END: stand-in API server
+
+# == BEG: baseline implementations
+#
+
+class LegacyCncAPIClientCore(api.CncAPIClientCore):
+    """API client core with the flush-then-recv transport used up to version 1.5.3."""
+
+    # overrides the name mangled private method used by all get/set/cmd requests
+    def _CncAPIClientCore__send_command(self, request: str, first_timeout: float = 5.0, chunk_timeout: float = 2.0) -> str:
+
+        def __flush_receiving_buffer(max_flush: int = 1048576):
+            try:
+                self.ipc.settimeout(0.0)
+                flushed = 0
+                while flushed < max_flush:
+                    data = self.ipc.recv(4096)
+                    if not data:
+                        break
+                    flushed += len(data)
+            except (BlockingIOError, socket.error):
+                pass
+
+        if not self.is_connected or not request:
+            return ''
+        if not request.endswith('\n'):
+            request += '\n'
+        try:
+            __flush_receiving_buffer()
+            self.ipc.sendall(request.encode())
+            buffer = bytearray()
+            search_start = 0
+            first_chunk = True
+            self.ipc.settimeout(first_timeout)
+            while True:
+                chunk = self.ipc.recv(65536)
+                if not chunk:
+                    self.close()
+                    return ''
+                if first_chunk:
+                    self.ipc.settimeout(chunk_timeout)
+                    first_chunk = False
+                buffer.extend(chunk)
+                newline_pos = buffer.find(b'\n', search_start)
+                if newline_pos != -1:
+                    return buffer[:newline_pos].decode('utf-8')
+                search_start = len(buffer)
+        except socket.timeout:
+            return ''
+        except socket.error:
+            self.close()
+            return ''
+
+def legacy_set_cnc_parameters_request(address: int, values: list, descriptions: list) -> str:
+    """Builds the set cnc.parameters request as set_cnc_parameters() did up to version 1.5.3."""
+    request = '{"set":"cnc.parameters","address":' + str(address) + ','
+    request += '"values":['
+    for idx, value in enumerate(values):
+        request = request + str(value)
+        if idx < (len(values) - 1):
+            request = request + ','
+    request += '],"descriptions":['
+    for idx, value in enumerate(descriptions):
+        request = request + '"' + value + '"'
+        if idx < (len(descriptions) - 1):
+            request = request + ','
+    request += ']}'
+    return request
+
+def legacy_decode_axes_info(data: api.APIAxesInfo, j: dict) -> api.APIAxesInfo:
+    """Decodes a axes.info response as get_axes_info() did up to version 1.5.3."""
+    data.joint_position                     = j['res']['joint.position']
+    data.machine_position                   = j['res']['machine.position']
+    data.program_position                   = j['res']['program.position']
+    data.machine_target_position            = j['res']['machine.target.position']
+    data.program_target_position            = j['res']['program.target.position']
+    data.actual_velocity                    = j['res']['actual.velocity']
+    data.working_wcs                        = j['res']['working.wcs']
+    data.working_offset                     = j['res']['working.offset']
+    data.dynamic_offset                     = j['res']['dynamic.offset']
+    data.homing_done                        = j['res']['homing.done']
+    data.homing_done_mask                   = j['res']['homing.done.mask']
+    data.homing_running_mask                = j['res']['homing.running.mask']
+    data.homing_sensors_mask                = j['res']['homing.sensors.mask']
+    data.homing_correction_space            = j['res']['homing.correction.space']
+    return data
+
+def legacy_decode_cnc_info(data: api.APICncInfo, j: dict) -> api.APICncInfo:
+    """Decodes a cnc.info response as get_cnc_info() did up to version 1.5.3."""
+    data.units_mode                         = j['res']['units.mode']
+    data.axes_mask                          = j['res']['axes.mask']
+    data.state_machine                      = j['res']['state.machine']
+    data.gcode_line                         = j['res']['gcode.line']
+    data.planned_time                       = j['res']['planned.time']
+    data.worked_time                        = j['res']['worked.time']
+    data.hud_user_message                   = j['res']['hud.user.message']
+    data.operator_request_id_pending        = j['res']['operator.request.id.pending']
+    data.current_alarm_datetime             = api._filetime_to_datetime(j['res']['current.alarm']['datetime'])
+    data.current_alarm_code                 = j['res']['current.alarm']['code']
+    data.current_alarm_info1                = j['res']['current.alarm']['info1']
+    data.current_alarm_info2                = j['res']['current.alarm']['info2']
+    data.current_alarm_text                 = j['res']['current.alarm']['text']
+    data.current_warning_datetime           = api._filetime_to_datetime(j['res']['current.warning']['datetime'])
+    data.current_warning_code               = j['res']['current.warning']['code']
+    data.current_warning_info1              = j['res']['current.warning']['info1']
+    data.current_warning_info2              = j['res']['current.warning']['info2']
+    data.current_warning_text               = j['res']['current.warning']['text']
+    data.aux_outputs                        = j['res']['aux.outputs']
+    data.coolant_mist                       = j['res']['coolant']['mist']
+    data.coolant_flood                      = j['res']['coolant']['flood']
+    data.lube_axis_cycles_made              = j['res']['lube']['axis.cycles.made']
+    data.lube_axis_time_to_next_cycle       = j['res']['lube']['axis.time.to.next.cycle']
+    data.lube_spindle_cycles_made           = j['res']['lube']['spindle.cycles.made']
+    data.lube_spindle_time_to_next_cycle    = j['res']['lube']['spindle.time.to.next.cycle']
+    data.feed_programmed                    = j['res']['feed']['programmed']
+    data.feed_target                        = j['res']['feed']['target']
+    data.feed_reference                     = j['res']['feed']['reference']
+    data.spindle_programmed                 = j['res']['spindle']['programmed']
+    data.spindle_target                     = j['res']['spindle']['target']
+    data.spindle_actual                     = j['res']['spindle']['actual']
+    data.spindle_load                       = j['res']['spindle']['load']
+    data.spindle_torque                     = j['res']['spindle']['torque']
+    data.spindle_phase                      = j['res']['spindle']['phase']
+    data.spindle_direction                  = j['res']['spindle']['direction']
+    data.spindle_not_ready                  = j['res']['spindle']['not.ready']
+    data.spindle_shaft                      = j['res']['spindle']['shaft']
+    data.spindle_status                     = j['res']['spindle']['status']
+    data.spindle_voltage                    = j['res']['spindle']['voltage']
+    data.override_jog                       = j['res']['override']['jog']
+    data.override_jog_min                   = j['res']['override']['jog.min']
+    data.override_jog_max                   = j['res']['override']['jog.max']
+    data.override_jog_enabled               = j['res']['override']['jog.enabled']
+    data.override_jog_locked                = j['res']['override']['jog.locked']
+    data.override_spindle                   = j['res']['override']['spindle']
+    data.override_spindle_min               = j['res']['override']['spindle.min']
+    data.override_spindle_max               = j['res']['override']['spindle.max']
+    data.override_spindle_enabled           = j['res']['override']['spindle.enabled']
+    data.override_spindle_locked            = j['res']['override']['spindle.locked']
+    data.override_fast                      = j['res']['override']['fast']
+    data.override_fast_min                  = j['res']['override']['fast.min']
+    data.override_fast_max                  = j['res']['override']['fast.max']
+    data.override_fast_enabled              = j['res']['override']['fast.enabled']
+    data.override_fast_locked               = j['res']['override']['fast.locked']
+    data.override_feed                      = j['res']['override']['feed']
+    data.override_feed_min                  = j['res']['override']['feed.min']
+    data.override_feed_max                  = j['res']['override']['feed.max']
+    data.override_feed_enabled              = j['res']['override']['feed.enabled']
+    data.override_feed_locked               = j['res']['override']['feed.locked']
+    data.override_feed_custom_1             = j['res']['override']['feed.custom.1']
+    data.override_feed_custom_1_min         = j['res']['override']['feed.custom.1.min']
+    data.override_feed_custom_1_max         = j['res']['override']['feed.custom.1.max']
+    data.override_feed_custom_1_enabled     = j['res']['override']['feed.custom.1.enabled']
+    data.override_feed_custom_1_locked      = j['res']['override']['feed.custom.1.locked']
+    data.override_feed_custom_2             = j['res']['override']['feed.custom.2']
+    data.override_feed_custom_2_min         = j['res']['override']['feed.custom.2.min']
+    data.override_feed_custom_2_max         = j['res']['override']['feed.custom.2.max']
+    data.override_feed_custom_2_enabled     = j['res']['override']['feed.custom.2.enabled']
+    data.override_feed_custom_2_locked      = j['res']['override']['feed.custom.2.locked']
+    data.override_plasma_power              = j['res']['override']['plasma.power']
+    data.override_plasma_power_min          = j['res']['override']['plasma.power.min']
+    data.override_plasma_power_max          = j['res']['override']['plasma.power.max']
+    data.override_plasma_power_enabled      = j['res']['override']['plasma.power.enabled']
+    data.override_plasma_power_locked       = j['res']['override']['plasma.power.locked']
+    data.override_plasma_voltage            = j['res']['override']['plasma.voltage']
+    data.override_plasma_voltage_min        = j['res']['override']['plasma.voltage.min']
+    data.override_plasma_voltage_max        = j['res']['override']['plasma.voltage.max']
+    data.override_plasma_voltage_enabled    = j['res']['override']['plasma.voltage.enabled']
+    data.override_plasma_voltage_locked     = j['res']['override']['plasma.voltage.locked']
+    data.tool_id                            = j['res']['tool']['id']
+    data.tool_slot                          = j['res']['tool']['slot']
+    data.tool_slot_enabled                  = j['res']['tool']['slot.enabled']
+    data.tool_type                          = j['res']['tool']['type']
+    data.tool_diameter                      = j['res']['tool']['diameter']
+    data.tool_offset_x                      = j['res']['tool']['offset.x']
+    data.tool_offset_y                      = j['res']['tool']['offset.y']
+    data.tool_offset_z                      = j['res']['tool']['offset.z']
+    data.tool_param_1                       = j['res']['tool']['param.1']
+    data.tool_param_2                       = j['res']['tool']['param.2']
+    data.tool_param_3                       = j['res']['tool']['param.3']
+    data.tool_description                   = j['res']['tool']['description']
+    return data
+
+def dict_based_class(cls: type) -> type:
+    """Returns a copy of an APIxx class keeping attributes in a per-instance __dict__ as up to version 1.5.3."""
+    namespace = {name: value for name, value in vars(cls).items() if isinstance(value, type)}
+    namespace['__init__'] = cls.__init__
+    return type(cls.__name__, (), namespace)
+
+def legacy_deep_compare(a, b) -> bool:
+    """Compares two values as APIComparableMixin.is_equal() did up to version 1.5.3 (walking slots in place of __dict__)."""
+    if type(a) != type(b):
+        return False
+    if isinstance(a, list):
+        if len(a) != len(b):
+            return False
+        return all(legacy_deep_compare(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict):
+        if a.keys() != b.keys():
+            return False
+        return all(legacy_deep_compare(a[k], b[k]) for k in a)
+    if api._slots_of(a.__class__):
+        return legacy_deep_compare(api._fields(a), api._fields(b))
+    return a == b
+
+#
+# == END: baseline implementations
+
+# == BEG: support methods
+#
+
+def new_tool(**fields) -> dict:
+    """Returns a tool of the stand-in tools library with defaults for missing fields."""
+    tool = {'id': 0, 'slot': 0, 'type': api.TT_GENERIC, 'diameter': 0.0, 'offset.x': 0.0, 'offset.y': 0.0, 'offset.z': 0.0}
+    tool |= {f'param.{i}': 0.0 for i in [*range(1, 11), *range(51, 61)]}
+    tool |= {'description': ''}
+    tool |= {key: float(value) if isinstance(tool.get(key), float) else value for key, value in fields.items()}
+    return tool
+
+def log_command(command: str):
+    print()
+    print(command)
+    print("=" * len(command))
+
+def measure(call, count: int, setup=None) -> dict:
+    """Calls count times the callable, after the optional untimed setup callable, and returns timing statistics."""
+    samples = []
+    for _ in range(count):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - t0)
+    samples.sort()
+    total = sum(samples)
+    return {
+        'rate': count / total,
+        'median': samples[len(samples) // 2] * 1e6,
+        'p99': samples[int(len(samples) * 0.99) - 1] * 1e6,
+    }
+
+def print_measure(name: str, result: dict):
+    print(f'{name:<40} {result["rate"]:10.0f} calls/s   median {result["median"]:8.1f} us   p99 {result["p99"]:8.1f} us')
+
+def connect(client: api.CncAPIClientCore, server: StandInServer) -> api.CncAPIClientCore:
+    if not client.connect('127.0.0.1', server.port):
+        print("No connection with stand-in API Server")
+        sys.exit()
+    client.ipc.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return client
+
+#
+# == END: support methods
+
+# == BEG: benchmarks
+#
+
+def bench_send_command(count: int = 20000):
+    log_command('BENCH: SEND COMMAND (flush-then-recv vs framed reader)')
+    server = StandInServer().start()
+    legacy = connect(LegacyCncAPIClientCore(), server)
+    framed = connect(api.CncAPIClientCore(), server)
+    for name, client in [('before: get_axes_info()', legacy), ('after:  get_axes_info()', framed)]:
+        assert client.get_axes_info().has_data
+        print_measure(name, measure(client.get_axes_info, count))
+    for name, client in [('before: cnc_stop()', legacy), ('after:  cnc_stop()', framed)]:
+        assert client.cnc_stop()
+        print_measure(name, measure(client.cnc_stop, count))
+    legacy.close()
+    framed.close()
+    server.stop()
+
+def bench_pipeline(count: int = 500, delay: float = 0.001):
+    log_command(f'BENCH: INFO CONTEXT UPDATE (sequential vs pipelined, {delay * 1000:.1f} ms server delay)')
+    server = StandInServer(delay=delay).start()
+    core = connect(api.CncAPIClientCore(), server)
+
+    def sequential_update():
+        core.get_axes_info()
+        core.get_cnc_info()
+        core.get_compile_info()
+        core.get_enabled_commands()
+
+    ctx = api.CncAPIInfoContext(core)
+    assert ctx.update() and ctx.cnc_info.has_data and ctx.enabled_commands.has_data
+    print_measure('before: 4 sequential requests', measure(sequential_update, count))
+    print_measure('after:  CncAPIInfoContext.update()', measure(ctx.update, count))
+    core.close()
+    server.stop()
+
+def bench_contention(count: int = 400, delay: float = 0.0005):
+    log_command(f'BENCH: THREADS CONTENTION (shared locked client vs pool, {delay * 1000:.1f} ms server delay)')
+    server = StandInServer(delay=delay).start()
+    shared = connect(api.CncAPIClientCore(), server)
+    pool = api.CncAPIClientPool()
+    assert pool.connect('127.0.0.1', server.port)
+
+    def run(client, threads: int) -> float:
+        failures = []
+
+        def worker(index: int):
+            for _ in range(count):
+                ok = client.get_axes_info().has_data if index % 2 == 0 else client.cnc_stop()
+                if not ok:
+                    failures.append(index)
+
+        workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        t0 = time.perf_counter()
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        elapsed = time.perf_counter() - t0
+        assert not failures
+        return threads * count / elapsed
+
+    for threads in [1, 2, 4]:
+        shared_rate = run(shared, threads)
+        pool_rate = run(pool, threads)
+        print(f'{threads} threads: shared client {shared_rate:8.0f} calls/s   pool ({pool.size}) {pool_rate:8.0f} calls/s')
+    shared.close()
+    pool.close()
+    server.stop()
+
+def bench_fleet(machines: int = 200, cycles: int = 20, delay: float = 0.001):
+    log_command(f'BENCH: FLEET POLLING ({machines} machines, {delay * 1000:.1f} ms server delay)')
+    server = StandInServer(delay=delay).start()
+    clients = [connect(api.CncAPIClientCore(), server) for _ in range(machines)]
+    poller = api.CncFleetPoller()
+    for i in range(machines):
+        poller.add_machine(f'cnc-{i:03d}', '127.0.0.1', server.port)
+    poller.poll()
+    assert all(poller.is_connected(name) for name in poller.machines)
+
+    def sequential_cycle():
+        for client in clients:
+            assert client.get_cnc_info().has_data and client.get_axes_info().has_data
+
+    def poller_cycle():
+        snapshot = poller.poll()
+        assert all(results['get_cnc_info'].has_data and results['get_axes_info'].has_data for results in snapshot.values())
+
+    print_measure('sequential clients cycle', measure(sequential_cycle, cycles))
+    print_measure('fleet poller cycle', measure(poller_cycle, cycles))
+    for client in clients:
+        client.close()
+    poller.close()
+    server.stop()
+
+def bench_subscriptions(consumers: int = 4, duration: float = 2.0):
+    log_command(f'BENCH: SUBSCRIPTIONS ({consumers} consumers, axes.info 200 Hz + cnc.info 20 Hz)')
+    topics = [('axes.info', 200.0), ('cnc.info', 20.0)]
+
+    # independent polling loops, one per consumer and topic
+    server = StandInServer().start()
+    clients = [connect(api.CncAPIClientCore(), server) for _ in range(consumers)]
+    stop_event = threading.Event()
+    handled = []
+
+    def polling_loop(client, topic: str, rate: float):
+        call = getattr(client, 'get_' + topic.replace('.', '_'))
+        while not stop_event.wait(1.0 / rate):
+            handled.append(call())
+
+    loops = [threading.Thread(target=polling_loop, args=(client, *topic)) for client in clients for topic in topics]
+    for loop in loops:
+        loop.start()
+    time.sleep(duration)
+    stop_event.set()
+    for loop in loops:
+        loop.join()
+    print(f'{"independent polling loops":<40} {server.requests / duration:10.0f} requests/s   {len(handled) / duration:8.0f} handled results/s')
+    for client in clients:
+        client.close()
+    server.stop()
+
+    # single subscription engine shared by all consumers
+    server = StandInServer().start()
+    client = connect(api.CncAPIClientCore(), server)
+    engine = api.CncSubscriptionEngine(client)
+    handled = []
+    for _ in range(consumers):
+        for topic, rate in topics:
+            assert engine.subscribe(topic, rate, lambda name, result: handled.append(result))
+    engine.start()
+    time.sleep(duration)
+    engine.stop()
+    print(f'{"subscription engine":<40} {server.requests / duration:10.0f} requests/s   {len(handled) / duration:8.0f} handled results/s')
+    client.close()
+    server.stop()
+
+def bench_adaptive_polling(idle_machines: int = 36, running_machines: int = 4, duration: float = 10.0, interval: float = 0.05):
+    log_command(f'BENCH: FLEET POLLING LOAD ({idle_machines} idle + {running_machines} running machines, fixed vs adaptive)')
+    running_responses = dict(RESPONSES)
+    running_responses['cnc.info'] = dict(RESPONSES['cnc.info'], **{'state.machine': api.SM_RUN})
+
+    for name, profile in [('fixed 50 ms interval', None), ('adaptive balanced profile', api.POLLING_PROFILE_BALANCED)]:
+        idle_server = StandInServer().start()
+        running_server = StandInServer(running_responses).start()
+        poller = api.CncFleetPoller(profile=profile)
+        for i in range(idle_machines):
+            poller.add_machine(f'idle-{i:02d}', '127.0.0.1', idle_server.port)
+        for i in range(running_machines):
+            poller.add_machine(f'running-{i:02d}', '127.0.0.1', running_server.port)
+        t0 = time.monotonic()
+        while time.monotonic() - t0 < duration:
+            poller.poll()
+            next_poll_time = time.monotonic() + interval if profile is None else poller.next_poll_time
+            time.sleep(max(0.0, next_poll_time - time.monotonic()))
+        requests = idle_server.requests + running_server.requests
+        print(
+            f'{name:<40} {requests / duration:10.0f} requests/s   '
+            f'running interval {poller.get_poll_interval("running-00") * 1000:6.1f} ms   '
+            f'idle interval {poller.get_poll_interval("idle-00") * 1000:6.1f} ms'
+        )
+        poller.close()
+        idle_server.stop()
+        running_server.stop()
+
+def bench_cache(count: int = 2000, delay: float = 0.0005):
+    log_command(f'BENCH: DASHBOARD REFRESH (no cache vs response cache, {delay * 1000:.1f} ms server delay)')
+    server = StandInServer(delay=delay).start()
+    client = connect(api.CncAPIClientCore(), server)
+
+    def dashboard_refresh():
+        assert client.get_system_info().has_data
+        assert client.get_localization_info().has_data
+        assert client.get_coordinate_systems_info().has_data
+        assert client.get_axes_info().has_data
+
+    for name, use_cache in [('before: no cache', False), ('after:  response cache', True)]:
+        if use_cache:
+            client.enable_cache()
+        server.requests = 0
+        print_measure(name, measure(dashboard_refresh, count))
+        print(f'{"":<40} {server.requests / count:10.2f} requests/refresh   hits {client.cache_hits}   misses {client.cache_misses}')
+    client.close()
+    server.stop()
+
+def bench_tools_lib_mirror(tools: int = 500, count: int = 2000, delay: float = 0.0005):
+    log_command(f'BENCH: TOOL LOOKUP BY ID ({tools} tools, requests vs local mirror, {delay * 1000:.1f} ms server delay)')
+    server = StandInServer(delay=delay).start()
+    server.tools = [new_tool(id=i + 1, slot=i + 1, diameter=float(i % 20)) for i in range(tools)]
+    client = connect(api.CncAPIClientCore(), server)
+    mirror = api.CncToolsLibMirror(client)
+    t0 = time.perf_counter()
+    assert mirror.sync()
+    print(f'{"mirror sync":<40} {(time.perf_counter() - t0) * 1e6:10.1f} us')
+    tool_ids = [(i * 7919) % tools + 1 for i in range(count)]
+
+    def lookup_by_requests():
+        tool_id = tool_ids[lookup_by_requests.i % count]
+        lookup_by_requests.i += 1
+        index = client.get_tools_lib_tool_index_from_id(tool_id).index
+        assert client.get_tools_lib_info(index).data.tool_id == tool_id
+    lookup_by_requests.i = 0
+
+    def lookup_by_mirror():
+        tool_id = tool_ids[lookup_by_mirror.i % count]
+        lookup_by_mirror.i += 1
+        assert mirror.get_by_id(tool_id).tool_id == tool_id
+    lookup_by_mirror.i = 0
+
+    print_measure('before: index from id + info', measure(lookup_by_requests, count))
+    print_measure('after:  mirror get_by_id()', measure(lookup_by_mirror, count))
+    t0 = time.perf_counter()
+    assert not mirror.resync_if_drifted()
+    print(f'{"mirror drift check":<40} {(time.perf_counter() - t0) * 1e6:10.1f} us')
+    client.close()
+    server.stop()
+
+def bench_tools_lib_import(tools: int = 500, delay: float = 0.0005):
+    log_command(f'BENCH: TOOLS LIBRARY IMPORT ({tools} tools, clear + sequential add vs pipelined diff, {delay * 1000:.1f} ms server delay)')
+    server = StandInServer(delay=delay).start()
+    client = connect(api.CncAPIClientCore(), server)
+    mirror = api.CncToolsLibMirror(client)
+    library = [new_tool(id=i + 1, slot=i + 1, diameter=float(i % 20), description=f'Tool {i + 1}') for i in range(tools)]
+    server.tools = [dict(tool) for tool in library]
+    path = os.path.join(tempfile.gettempdir(), 'cnc_api_client_core_benchmark_tools.csv')
+    assert mirror.sync() and mirror.export_tools_library(path)
+    infos = []
+    for tool in mirror.tools:
+        info = api.APIToolsLibInfoForSet()
+        for name, value in tool.as_dict().items():
+            setattr(info, name, value)
+        info.tool_index = None
+        infos.append(info)
+
+    def clear_and_add():
+        assert client.tools_lib_clear()
+        for info in infos:
+            assert client.tools_lib_add(info)
+
+    cases = [
+        ('before: clear + sequential add', 'empty', clear_and_add),
+        ('after:  import into empty library', 'empty', lambda: mirror.import_tools_library(path)),
+        ('after:  import, 5% changed tools', 'changed', lambda: mirror.import_tools_library(path)),
+        ('after:  import, same library', 'same', lambda: mirror.import_tools_library(path)),
+    ]
+    for name, initial, call in cases:
+        server.tools = [] if initial == 'empty' else [dict(tool) for tool in library]
+        if initial == 'changed':
+            for tool in server.tools[::20]:
+                tool['diameter'] += 1.0
+        server.requests = 0
+        t0 = time.perf_counter()
+        assert call() is not False
+        elapsed = time.perf_counter() - t0
+        assert server.tools == library
+        print(f'{name:<40} {elapsed * 1000:10.1f} ms   {server.requests:6d} requests')
+    os.remove(path)
+    client.close()
+    server.stop()
+
+def bench_parameters_read(count: int = 20, delay: float = 0.0005):
+    log_command(f'BENCH: READ {api.CNC_PARAMETERS_COUNT} CNC PARAMETERS (sequential chunks vs pipelined mirror, {delay * 1000:.1f} ms server delay)')
+    server = StandInServer(delay=delay).start()
+    server.parameters = [i * 0.001 for i in range(api.CNC_PARAMETERS_COUNT)]
+    client = connect(api.CncAPIClientCore(), server)
+    mirror = api.CncParametersMirror(client)
+
+    def sequential_chunks():
+        values = []
+        for address in range(0, api.CNC_PARAMETERS_COUNT, api.CNC_PARAMETERS_CHUNK):
+            values += client.get_cnc_parameters(address, api.CNC_PARAMETERS_CHUNK).values
+        assert len(values) == api.CNC_PARAMETERS_COUNT
+
+    print_measure('before: sequential get_cnc_parameters', measure(sequential_chunks, count))
+    print_measure('after:  read_parameters() (no cache)', measure(lambda: mirror.read_parameters(0, api.CNC_PARAMETERS_COUNT, max_age=0), count))
+    print_measure('after:  read_parameters() (cached)', measure(lambda: mirror.read_parameters(0, api.CNC_PARAMETERS_COUNT), count))
+    print_measure('after:  read_parameters() hot range', measure(lambda: mirror.read_parameters(4000, 4021), count * 100))
+    client.close()
+    server.stop()
+
+def bench_parameters_write(count: int = 20, elements: int = 10000, changed: int = 100):
+    log_command(f'BENCH: WRITE {elements} CNC PARAMETERS RECIPE ({changed} changed)')
+    server = StandInServer().start()
+    client = connect(api.CncAPIClientCore(), server)
+    mirror = api.CncParametersMirror(client)
+    recipe = [i * 0.001 for i in range(elements)]
+    texts = [f'RECIPE: parameter {i}' for i in range(elements)]
+    server.parameters[:elements] = recipe
+    server.parameters_descriptions[:elements] = texts
+    assert mirror.read_parameters(0, elements) is not None
+
+    print_measure('before: legacy request encoding', measure(lambda: legacy_set_cnc_parameters_request(0, recipe, texts), count))
+    print_measure('after:  linear request encoding', measure(lambda: api.CncAPIClientCore.create_compact_json_request(
+        {'set': 'cnc.parameters', 'address': 0, 'values': recipe, 'descriptions': texts}), count))
+    print_measure('after:  set_cnc_parameters() all', measure(lambda: client.set_cnc_parameters(0, recipe, texts), count))
+
+    def write_changed_recipe():
+        for i in range(0, elements, elements // changed):
+            recipe[i] += 1.0
+        server.requests = 0
+        assert mirror.write_parameters(0, recipe, texts, max_age=math.inf)
+        assert server.requests == changed
+
+    print_measure('after:  write_parameters() diff only', measure(write_changed_recipe, count))
+    client.close()
+    server.stop()
+
+def bench_parameters_snapshot(count: int = 20, changed: int = 10, delay: float = 0.0005):
+    log_command(f'BENCH: CNC PARAMETERS SNAPSHOT/RESTORE ({api.CNC_PARAMETERS_COUNT} parameters, {changed} changed, {delay * 1000:.1f} ms server delay)')
+    server = StandInServer(delay=delay).start()
+    server.parameters = [i * 0.001 for i in range(api.CNC_PARAMETERS_COUNT)]
+    server.parameters_descriptions = [f'PARAMETER {i}' for i in range(api.CNC_PARAMETERS_COUNT)]
+    client = connect(api.CncAPIClientCore(), server)
+    mirror = api.CncParametersMirror(client)
+    path = os.path.join(tempfile.gettempdir(), 'cnc_api_client_core_benchmark_parameters.bin')
+    snapshot = list(server.parameters)
+
+    print_measure('snapshot_parameters()', measure(lambda: mirror.snapshot_parameters(path), count))
+    print(f'{"":<40} {os.path.getsize(path):10d} bytes   json {len(json.dumps([server.parameters, server.parameters_descriptions])):10d} bytes')
+    print_measure('load_parameters_snapshot()', measure(lambda: mirror.load_parameters_snapshot(path), count))
+
+    def change_parameters():
+        for i in range(0, api.CNC_PARAMETERS_COUNT, api.CNC_PARAMETERS_COUNT // changed):
+            server.parameters[i] += 1.0
+        server.requests = 0
+
+    def full_restore():
+        change_parameters()
+        _, values, texts = mirror.load_parameters_snapshot(path)
+        for address in range(0, api.CNC_PARAMETERS_COUNT, api.CNC_PARAMETERS_CHUNK):
+            stop = address + api.CNC_PARAMETERS_CHUNK
+            assert client.set_cnc_parameters(address, list(values[address:stop]), texts[address:stop])
+        assert server.parameters == snapshot
+
+    def cold_restore():
+        change_parameters()
+        assert mirror.restore_parameters(path, max_age=0)
+        assert server.parameters == snapshot
+
+    def change_parameters_with_mirror():
+        # changes made through the mirror are known by it, so its cache stays fresh
+        for i in range(0, api.CNC_PARAMETERS_COUNT, api.CNC_PARAMETERS_COUNT // changed):
+            assert mirror.write_parameters(i, [server.parameters[i] + 1.0], max_age=math.inf)
+        server.requests = 0
+
+    def fresh_restore():
+        assert mirror.restore_parameters(path, max_age=math.inf)
+        assert server.parameters == snapshot
+
+    print_measure('before: restore with full writes', measure(full_restore, count))
+    print(f'{"":<40} {server.requests:10d} requests')
+    print_measure('after:  restore_parameters() cold', measure(cold_restore, count))
+    print(f'{"":<40} {server.requests:10d} requests')
+    print_measure('after:  restore_parameters() fresh', measure(fresh_restore, count, change_parameters_with_mirror))
+    print(f'{"":<40} {server.requests:10d} requests')
+    os.remove(path)
+    client.close()
+    server.stop()
+
+def bench_parameters_watchlist(count: int = 50, delay: float = 0.0005):
+    # 10 blocks of 20 counters with small holes and 100 isolated macro variables
+    rnd = random.Random(1)
+    watched = {block * 800 + i * rnd.randint(1, 3) for block in range(10) for i in range(20)}
+    watched |= {rnd.randrange(api.CNC_PARAMETERS_COUNT) for _ in range(100)}
+    watched = sorted(watched)
+    log_command(f'BENCH: CNC PARAMETERS WATCHLIST ({len(watched)} scattered addresses, {delay * 1000:.1f} ms server delay)')
+    server = StandInServer(delay=delay).start()
+    client = connect(api.CncAPIClientCore(), server)
+
+    def per_address_requests():
+        for address in watched:
+            assert client.get_cnc_parameters(address, 1).has_data
+
+    print_measure('before: one request per address', measure(per_address_requests, count))
+    print(f'{"":<40} {len(watched):10d} requests for {len(watched)} addresses')
+    for max_gap in [0, 4, 16, 64]:
+        watchlist = api.CncParametersWatchlist(client, max_gap=max_gap)
+        watchlist.add(watched)
+        print_measure(f'after:  watchlist poll (max gap {max_gap})', measure(watchlist.poll, count))
+        print(f'{"":<40} {len(watchlist.ranges):10d} requests for {len(watched)} addresses')
+    client.close()
+    server.stop()
+
+def bench_decoders(count: int = 20000):
+    log_command('BENCH: RESPONSE DECODERS (object creation + decode, json already parsed)')
+    for name, legacy_decode, decode, data_class in [
+        ('axes.info', legacy_decode_axes_info, api._decode_axes_info, api.APIAxesInfo),
+        ('cnc.info', legacy_decode_cnc_info, api._decode_cnc_info, api.APICncInfo),
+    ]:
+        j = {'res': RESPONSES[name]}
+        print_measure(f'before: {name} decode', measure(lambda: legacy_decode(data_class(), j), count))
+        print_measure(f'after:  {name} decode', measure(lambda: decode(data_class(), j['res']), count))
+
+def bench_data_classes(count: int = 10000):
+    log_command(f'BENCH: API DATA CLASSES FOOTPRINT ({count} snapshots, dict based vs __slots__)')
+    for cls in [api.APIAxesInfo, api.APICncInfo, api.APIMachineSettings, api.APIMachiningInfo]:
+        for label, data_class in [('before:', dict_based_class(cls)), ('after: ', cls)]:
+            tracemalloc.start()
+            snapshots = [data_class() for _ in range(count)]
+            size = tracemalloc.get_traced_memory()[0] - sys.getsizeof(snapshots)
+            tracemalloc.stop()
+            del snapshots
+            print_measure(f'{label} {cls.__name__} alloc', measure(data_class, count))
+            print(f'{"":<40} {size / count:10.0f} bytes per snapshot')
+
+def bench_in_place_update(count: int = 20000):
+    log_command(f'BENCH: IN PLACE UPDATE ({count} cnc.info polls, new instance vs into=)')
+    server = StandInServer().start()
+    client = connect(api.CncAPIClientCore(), server)
+    info = client.get_cnc_info()
+    changed = []
+    for name, poll in [
+        ('before: get_cnc_info()', client.get_cnc_info),
+        ('after:  get_cnc_info(into=)', partial(client.get_cnc_info, into=info)),
+        ('after:  get_cnc_info(into=, changed=)', partial(client.get_cnc_info, into=info, changed=changed)),
+    ]:
+        assert poll().has_data
+        collections = sum(stats['collections'] for stats in gc.get_stats())
+        print_measure(name, measure(poll, count))
+        print(f'{"":<40} {sum(stats["collections"] for stats in gc.get_stats()) - collections:10d} gc collections')
+    client.close()
+    server.stop()
+
+def bench_change_detection(count: int = 2000):
+    log_command('BENCH: CHANGE DETECTION (unchanged snapshots, recursive compare vs compiled compare and digest)')
+    history = {'list': [{'code': 1000 + i, 'info.1': i, 'info.2': 0, 'text': f'Alarm {i}', 'datetime': 134000000000000000 + i} for i in range(100)]}
+    server = StandInServer(dict(RESPONSES, **{'alarms.history.list': history})).start()
+    client = connect(api.CncAPIClientCore(), server)
+    for name, get in [('cnc.info', client.get_cnc_info), ('alarms.history.list', client.get_alarms_history_list)]:
+        last, snapshot = get(), get()
+        assert snapshot.has_data and snapshot.is_equal(last)
+        last_digest = last.digest()
+        print_measure(f'before: {name} deep compare', measure(lambda: legacy_deep_compare(snapshot, last), count))
+        print_measure(f'after:  {name} is_equal()', measure(lambda: snapshot.is_equal(last), count))
+        print_measure(f'after:  {name} digest()', measure(lambda: snapshot.digest() == last_digest, count))
+    client.close()
+    server.stop()
+
+def bench_delta_serialization(count: int = 2000):
+    log_command(f'BENCH: DASHBOARD GATEWAY ({count} cnc.info ticks, full snapshot vs delta JSON)')
+    server = StandInServer().start()
+    client = connect(api.CncAPIClientCore(), server)
+    rnd = random.Random(1)
+
+    # every tick the running machine changes spindle load, feed reference and worked time
+    snapshots = []
+    for tick in range(count):
+        info = client.get_cnc_info()
+        info.spindle_load = rnd.uniform(10.0, 60.0)
+        info.feed_reference = rnd.choice([1000.0, 1200.0])
+        info.worked_time = f'00:{tick // 60 % 60:02d}:{tick % 60:02d}'
+        snapshots.append(info)
+
+    def full_payloads():
+        return [api.APIComparableMixin.diff_to_json(snapshot.as_dict()) for snapshot in snapshots]
+
+    def delta_payloads():
+        return [api.APIComparableMixin.diff_to_json(api.APIComparableMixin.diff(old, new)) for old, new in zip([None] + snapshots, snapshots)]
+
+    for name, payloads in [('before: full snapshot JSON', full_payloads), ('after:  delta JSON', delta_payloads)]:
+        t0 = time.perf_counter()
+        size = sum(len(payload) for payload in payloads())
+        elapsed = time.perf_counter() - t0
+        print(f'{name:<40} {size / count:10.0f} bytes/tick   {elapsed / count * 1e6:8.1f} us/tick')
+    client.close()
+    server.stop()
+
+def bench_lazy_decode(count: int = 20000):
+    log_command('BENCH: LAZY DECODE (recorded responses, object creation + decode + 3 fields read, lazy-off: not enabled)')
+    for name, data_class, fields in [
+        ('axes.info', api.APIAxesInfo, ('machine_position', 'actual_velocity', 'working_wcs')),
+        ('cnc.info', api.APICncInfo, ('state_machine', 'spindle_load', 'feed_reference')),
+        ('compile.info', api.APICompileInfo, ('code', 'code_line', 'file_name')),
+        ('enabled.commands', api.APIEnabledCommands, ('cnc_start', 'cnc_stop', 'cnc_pause')),
+        ('coordinate.systems.info', api.APICoordinateSystemsInfo, ('working_wcs', 'working_offset', 'wcs_1')),
+        ('localization.info', api.APILocalizationInfo, ('units_mode', 'locale_name', 'description')),
+        ('system.info', api.APISystemInfo, ('machine_name', 'control_software_version', 'serial_number')),
+    ]:
+        res = RESPONSES[name]
+        key = name.replace('.', '_')
+        decode = getattr(api, '_decode_' + key)
+        lazy_decode = getattr(api, '_lazy_' + key, None)
+        enabled = lazy_decode is not None
+        if not enabled:
+            # a temporary lazy decoder, unregistered so the client keeps the eager decode
+            lazy_decode = api._lazy_decoder(data_class, getattr(api, '_SCHEMA_' + key.upper()))
+            del api._LAZY_FIELDS_BY_CLASS[data_class]
+
+        def read(data):
+            return [getattr(data, field) for field in fields]
+
+        assert read(lazy_decode(data_class.__new__(data_class), res)) == read(decode(data_class(), res))
+        print_measure(f'before: {name} eager', measure(lambda: read(decode(data_class(), res)), count))
+        print_measure(
+            f'after:  {name} lazy' + ('' if enabled else '-off'),
+            measure(lambda: read(lazy_decode(data_class.__new__(data_class), res)), count),
+        )
+
+def bench_direct_access(count: int = 20000):
+    log_command(f'BENCH: DIRECT ACCESS ({count} requests, TCP vs direct JSON text vs direct structured)')
+    server = StandInServer().start()
+    tcp_client = connect(api.CncAPIClientCore(), server)
+
+    # the stand-in module replaces cnc_direct_access, which is available only inside the CNC process
+    saved = (getattr(api, 'cda', None), api.cnc_direct_access_available, api.cnc_direct_access_structured_available)
+    api.cda, api.cnc_direct_access_available, api.cnc_direct_access_structured_available = StandInDirectAccess(), True, True
+    text_client = api.CncAPIClientCore()
+    text_client.connect_direct(structured=False)
+    structured_client = api.CncAPIClientCore()
+    structured_client.connect_direct()
+    for name, method in [('axes.info', 'get_axes_info'), ('cnc.info', 'get_cnc_info')]:
+        for label, client in [
+            ('before: TCP', tcp_client),
+            ('before: direct text', text_client),
+            ('after:  direct structured', structured_client),
+        ]:
+            get = getattr(client, method)
+            assert get().is_equal(getattr(tcp_client, method)())
+            print_measure(f'{label} {name}', measure(get, count))
+    api.cda, api.cnc_direct_access_available, api.cnc_direct_access_structured_available = saved
+    for client in [tcp_client, text_client, structured_client]:
+        client.close()
+    server.stop()
+
+def bench_json_codecs(count: int = 500, tools: int = 500, delay: float = 0.0005):
+    log_command(f'BENCH: JSON CODECS (tools.lib.infos with {tools} tools, str decode vs bytes decode by codec)')
+    tools_lib = [new_tool(id=i + 1, slot=i + 1, diameter=float(i % 20), description=f'Tool {i + 1}') for i in range(tools)]
+    response = json.dumps({'res': {'slot.enabled': True, 'tools': [dict(tool, index=i) for i, tool in enumerate(tools_lib)]}}, separators=(',', ':')).encode()
+    request = {'set': 'cnc.parameters', 'address': 0, 'values': [i * 0.001 for i in range(api.CNC_PARAMETERS_CHUNK)]}
+    server = StandInServer(delay=delay).start()
+    server.tools = tools_lib
+    client = connect(api.CncAPIClientCore(), server)
+    saved = api.json_codec
+    print(f'{"response size":<40} {len(response):10d} bytes')
+    print_measure('before: json decode of str', measure(lambda: json.loads(response.decode('utf-8')), count))
+    print_measure('before: json request encode', measure(lambda: json.dumps(request, separators=(',', ':')), count))
+    for codec in api.JSON_CODECS:
+        if api.set_json_codec(codec) != codec:
+            print(f'{codec:<40} not installed')
+            continue
+        assert api._loads(response) == json.loads(response)
+        print_measure(f'after:  {codec} decode of bytes', measure(lambda: api._loads(response), count))
+        print_measure(f'after:  {codec} request encode', measure(lambda: api.CncAPIClientCore.create_compact_json_request(request), count))
+        print_measure(f'after:  {codec} get_tools_lib_infos()', measure(client.get_tools_lib_infos, count // 5))
+    api.set_json_codec(saved)
+    client.close()
+    server.stop()
+
+def bench_program_streaming(lines: int = 500000):
+    log_command(f'BENCH: PROGRAM INFO ({lines} G-code lines, whole response vs streaming decode)')
+    code = ''.join(f'N{i} G01 X{i * 0.001:.3f} Y{-i * 0.002:.3f} F1200 ; pass {i // 1000}\n' for i in range(lines))
+    server = StandInServer(dict(RESPONSES, **{'program.info': {'file.name': 'big.ngc', 'code': code}})).start()
+    client = connect(api.CncAPIClientCore(), server)
+    file_name = os.path.join(tempfile.mkdtemp(), 'big.ngc')
+
+    def count_lines():
+        return sum(1 for _ in client.iter_program_code())
+
+    print(f'{"program size":<40} {len(code) / 1e6:10.1f} MB')
+    for name, get in [
+        ('before: get_program_info()', client.get_program_info),
+        ('after:  get_program_info_to_file()', partial(client.get_program_info_to_file, file_name)),
+        ('after:  iter_program_code()', count_lines),
+    ]:
+        # a new connection for every run, so the receiving buffer grown by a previous run is released
+        client.close()
+        connect(client, server)
+        t0 = time.perf_counter()
+        result = get()
+        elapsed = time.perf_counter() - t0
+        assert result == lines if isinstance(result, int) else result.has_data
+        del result
+
+        # peak memory is traced in another run, because tracing slows down the allocations
+        client.close()
+        connect(client, server)
+        tracemalloc.start()
+        get()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f'{name:<40} {elapsed * 1e3:10.1f} ms   peak {peak / 1e6:8.1f} MB')
+    with open(file_name, encoding='utf-8', newline='') as file:
+        assert file.read() == code
+    os.remove(file_name)
+    client.close()
+    server.stop()
+
+def bench_program_upload(lines: int = 1000000):
+    log_command(f'BENCH: PROGRAM UPLOAD ({lines} G-code lines, set text vs pipelined add text chunks)')
+    file_name = os.path.join(tempfile.mkdtemp(), 'big.ngc')
+    with open(file_name, 'w', encoding='utf-8', newline='') as file:
+        file.writelines(f'N{i} G01 X{i * 0.001:.3f} Y{-i * 0.002:.3f} F1200 ; pass {i // 1000}\n' for i in range(lines))
+    size = os.path.getsize(file_name)
+    server = StandInServer().start()
+    client = connect(api.CncAPIClientCore(), server)
+
+    def set_text():
+        with open(file_name, encoding='utf-8', newline='') as file:
+            return client.program_gcode_set_text(file.read())
+
+    print(f'{"program size":<40} {size / 1e6:10.1f} MB')
+    print(f'{"":<40} peak memory includes the stand-in server, which keeps the uploaded program')
+    for name, upload in [
+        ('before: program_gcode_set_text()', set_text),
+        ('after:  program_gcode_upload()', partial(client.program_gcode_upload, file_name)),
+        ('after:  program_gcode_upload(verify)', partial(client.program_gcode_upload, file_name, verify=True)),
+    ]:
+        t0 = time.perf_counter()
+        assert upload()
+        elapsed = time.perf_counter() - t0
+        assert sum(len(text) for text in server.program) == size
+        server.program = None
+        if 'verify' in name:
+            print(f'{name:<40} {elapsed * 1e3:10.1f} ms   {size / elapsed / 1e6:8.1f} MB/s')
+            continue
+
+        # peak memory is traced in another run, because tracing slows down the allocations
+        tracemalloc.start()
+        upload()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        server.program = None
+        print(f'{name:<40} {elapsed * 1e3:10.1f} ms   {size / elapsed / 1e6:8.1f} MB/s   peak {peak / 1e6:8.1f} MB')
+    os.remove(file_name)
+    client.close()
+    server.stop()
+
+def bench_ensure_program(lines: int = 200000, cycles: int = 10):
+    log_command(f'BENCH: PROGRAM BEFORE EVERY CYCLE ({cycles} cycles, {lines} G-code lines, set text vs ensure_program)')
+    code = ''.join(f'N{i} G01 X{i * 0.001:.3f} Y{-i * 0.002:.3f} F1200 ; pass {i // 1000}\n' for i in range(lines))
+    server = StandInServer().start()
+    client = connect(api.CncAPIClientCore(), server)
+    print(f'{"program size":<40} {len(code) / 1e6:10.1f} MB')
+    for name, send in [
+        ('before: program_gcode_set_text()', partial(client.program_gcode_set_text, code)),
+        ('after:  ensure_program()', partial(client.ensure_program, code)),
+    ]:
+        # a new connection, so the first ensure_program() reads the program to know its hash
+        client.close()
+        connect(client, server)
+        server.program = [code]
+        requests = server.requests
+        t0 = time.perf_counter()
+        for _ in range(cycles):
+            assert send()
+        elapsed = time.perf_counter() - t0
+        print(f'{name:<40} {elapsed / cycles * 1e3:10.1f} ms/cycle   {(server.requests - requests) / cycles:8.1f} requests/cycle')
+    client.close()
+    server.stop()
+
+#
+# == END: benchmarks
+
+if __name__ == '__main__':
+    bench_send_command()
+    bench_pipeline()
+    bench_contention()
+    bench_fleet()
+    bench_subscriptions()
+    bench_adaptive_polling()
+    bench_cache()
+    bench_tools_lib_mirror()
+    bench_tools_lib_import()
+    bench_parameters_read()
+    bench_parameters_write()
+    bench_parameters_snapshot()
+    bench_parameters_watchlist()
+    bench_decoders()
+    bench_data_classes()
+    bench_in_place_update()
+    bench_change_detection()
+    bench_delta_serialization()
+    bench_lazy_decode()
+    bench_direct_access()
+    bench_json_codecs()
+    bench_program_streaming()
+    bench_program_upload()
+    bench_ensure_program()
@@ -0,0 +1,329 @@
+"""CNC API Client Core for RosettaCNC & derivated NC Systems Test with stand-in API server."""
+#-------------------------------------------------------------------------------
+# Name:         cnc_api_client_core_test_stand_in
+#
+# Purpose:      CNC API Client Core for RosettaCNC & derivated NC Systems Test
+#               with stand-in API server
+#
+# Note          Compatible with API server version 1.5.3
+#               1 (on 1.x.y) means interface contract
+#               x (on 1.x.y) means version
+#               y (on 1.x.y) means release
+#
+# Note          Checked with Python 3.11.9
+#
+# Note          The tests run against the local stand-in API server of the benchmark,
+#               which answers with recorded responses, so no RosettaCNC Control
+#               Software is needed. Every test checks its results with assert, so
+#               the script stops at the first failure.
+#
+# Author:       support@rosettacnc.com
+#
+# Created:      17/10/2026
+# Copyright:    RosettaCNC (c) 2016-2026
+# Licence:      RosettaCNC License 1.0 (RCNC-1.0)
+# Coding Style  https://www.python.org/dev/peps/pep-0008/
+#-------------------------------------------------------------------------------
+# pylint: disable=C0103 -> invalid-name
+# pylint: disable=C0116 -> missing-function-docstring
+# pylint: disable=C0301 -> line-too-long
+# pylint: disable=W0718 -> broad-exception-caught           ## take care when you use that ##
+#-------------------------------------------------------------------------------
+from __future__ import annotations
+
+import os
+import json
+import time
+import socket
+import asyncio
+import tempfile
+import threading
+
+import cnc_api_client_core as api
+from cnc_api_client_core_benchmark import RESPONSES, StandInServer, connect, log_command
+
+# == BEG: support methods
+#
+
+class SplitResponsesServer:
+    """Local stand-in API server which sends its responses split in chunks of chunk_size bytes."""
+
+    def __init__(self, responses: dict, chunk_size: int):
+        self.responses = StandInServer(responses).responses
+        self.chunk_size = chunk_size
+        self.port = 0
+        self.__socket = None
+
+    def start(self) -> SplitResponsesServer:
+        """Starts the server on a free localhost port."""
+        self.__socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.__socket.bind(('127.0.0.1', 0))
+        self.__socket.listen(16)
+        self.port = self.__socket.getsockname()[1]
+        threading.Thread(target=self.__accept_loop, daemon=True).start()
+        return self
+
+    def stop(self):
+        """Stops the server."""
+        try:
+            self.__socket.close()
+        except Exception:
+            pass
+
+    def __accept_loop(self):
+        while True:
+            try:
+                connection, _ = self.__socket.accept()
+            except Exception:
+                return
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self.__client_loop, args=(connection,), daemon=True).start()
+
+    def __client_loop(self, connection: socket.socket):
+        buffer = bytearray()
+        with connection:
+            while True:
+                try:
+                    chunk = connection.recv(65536)
+                except Exception:
+                    return
+                if not chunk:
+                    return
+                buffer += chunk
+                *lines, rest = buffer.split(b'\n')
+                buffer = bytearray(rest)
+                answers = []
+                for line in lines:
+                    if line.strip():
+                        request = json.loads(line)
+                        name = request.get('get') or request.get('cmd') or request.get('set')
+                        answers.append(self.responses.get(name, b'{"res":true}\n'))
+
+                # all answers are sent together, so a chunk can end a response and begin the next one
+                answer = b''.join(answers)
+                for i in range(0, len(answer), self.chunk_size):
+                    connection.sendall(answer[i:i + self.chunk_size])
+                    time.sleep(0.0002)
+
+class RecordingList(list):
+    """List which records the (start, stop) ranges assigned by slice."""
+
+    def __init__(self, values: list):
+        super().__init__(values)
+        self.assigned = []
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self.assigned.append((index.start, index.stop))
+        super().__setitem__(index, value)
+
+#
+# == END: support methods
+
+# == BEG: tests
+#
+
+def test_framed_reads_split_across_recv_into():
+    log_command('TEST: FRAMED READS SPLIT ACROSS RECV_INTO')
+    reference_server = StandInServer().start()
+    reference = connect(api.CncAPIClientCore(), reference_server)
+    expected_axes_info = reference.get_axes_info()
+    expected_system_info = reference.get_system_info()
+    reference.close()
+    reference_server.stop()
+
+    # a response longer than the receiving buffer makes it grow while the response is split
+    responses = dict(RESPONSES)
+    responses['system.info'] = dict(RESPONSES['system.info'], **{'machine.name': 'M' * (3 * api.RX_BUFFER_SIZE)})
+    for chunk_size in (1, 7, 4096):
+        server = SplitResponsesServer(responses, chunk_size).start()
+        client = connect(api.CncAPIClientCore(), server)
+        axes_info = client.get_axes_info()
+        assert axes_info.has_data
+        assert axes_info.is_equal(expected_axes_info)
+
+        # pipelined responses are sent together, so they are split at any byte of any response
+        axes_info, cnc_info, axes_info_again = client.send_many([client.get_axes_info, client.get_cnc_info, client.get_axes_info])
+        assert axes_info.is_equal(expected_axes_info) and axes_info_again.is_equal(expected_axes_info)
+        assert cnc_info.has_data
+        if chunk_size > 1:
+            system_info = client.get_system_info()
+            assert system_info.machine_name == 'M' * (3 * api.RX_BUFFER_SIZE)
+            assert system_info.core_version == expected_system_info.core_version
+            assert client.get_axes_info().is_equal(expected_axes_info)
+        client.close()
+        server.stop()
+        print(f'chunk size {chunk_size:5d}: OK')
+
+def test_send_many_ordering():
+    log_command('TEST: SEND MANY ORDERING')
+    server = StandInServer(delay=0.001).start()
+    count = api.PIPELINE_MAX_REQUESTS + 20
+    server.parameters[:count] = [float(i) for i in range(count)]
+    client = connect(api.CncAPIClientCore(), server)
+
+    # results are in the order of the calls, also across batches and with not pipelined calls
+    calls = [(client.get_cnc_parameters, address, 1) for address in range(count)]
+    calls.insert(5, client.get_axes_info)
+    calls.insert(50, client.get_cnc_info)
+    calls.insert(70, (client.set_program_position_x_with_laser_reference, 0.0))
+    results = client.send_many(calls)
+    assert len(results) == len(calls)
+    address = 0
+    for call, result in zip(calls, results):
+        method = call[0] if isinstance(call, tuple) else call
+        if method == client.get_cnc_parameters:
+            assert isinstance(result, api.APICncParameters)
+            assert result.has_data and list(result.values) == [float(address)]
+            address += 1
+        elif method == client.get_axes_info:
+            assert isinstance(result, api.APIAxesInfo) and result.has_data
+        elif method == client.get_cnc_info:
+            assert isinstance(result, api.APICncInfo) and result.has_data
+        else:
+            # the stand-in server has no scanning laser info, so the request fails at its position
+            assert result is False
+    client.close()
+    server.stop()
+    print(f'{len(calls)} calls: OK')
+
+def test_async_upload_with_generator_source():
+    log_command('TEST: ASYNC UPLOAD WITH GENERATOR SOURCE')
+    server = StandInServer().start()
+    lines = [f'N{i} G01 X{i * 0.001:.3f} Y{-i * 0.002:.3f} F1200\n' for i in range(5000)]
+    code = ''.join(lines)
+    progresses = []
+
+    async def upload() -> bool:
+        client = api.AsyncCncAPIClientCore()
+        assert await client.connect('127.0.0.1', server.port)
+        try:
+            # the generator is read once, while the chunks are sent
+            source = (line for line in lines)
+            result = await client.program_gcode_upload(source, chunk_size=100, window=4, progress=lambda sent, rate: progresses.append(sent))
+            assert not await client.program_gcode_upload(iter([]), chunk_size=0)
+            assert (await client.get_axes_info()).has_data
+            return result
+        finally:
+            await client.close()
+
+    assert asyncio.run(upload())
+    assert ''.join(server.program) == code
+    assert all(len(text) <= 100 for text in server.program[1:])
+    assert progresses == sorted(progresses) and progresses[-1] == len(code)
+    server.stop()
+    print(f'{len(server.program) - 1} chunks, {len(code)} characters: OK')
+
+def test_cold_restore_parameters_sends_only_diffs():
+    log_command('TEST: COLD RESTORE PARAMETERS SENDS ONLY DIFFS')
+    server = StandInServer().start()
+    server.parameters = RecordingList([i * 0.001 for i in range(api.CNC_PARAMETERS_COUNT)])
+    server.parameters_descriptions = RecordingList([f'PARAMETER {i}' for i in range(api.CNC_PARAMETERS_COUNT)])
+    client = connect(api.CncAPIClientCore(), server)
+    mirror = api.CncParametersMirror(client)
+    path = os.path.join(tempfile.gettempdir(), 'cnc_api_client_core_test_stand_in_parameters.bin')
+    try:
+        snapshot = list(server.parameters)
+        assert mirror.snapshot_parameters(path)
+
+        # changes made by another client, so the mirror is cold
+        changed = set(range(17, api.CNC_PARAMETERS_COUNT, 997))
+        for address in changed:
+            server.parameters[address] += 1.0
+        server.parameters.assigned.clear()
+        server.parameters_descriptions.assigned.clear()
+        server.requests = 0
+        assert mirror.restore_parameters(path, max_age=0)
+        assert list(server.parameters) == snapshot
+
+        # every written range contains a changed parameter, and descriptions are written only with them
+        assert server.parameters.assigned
+        written = set()
+        for start, stop in server.parameters.assigned:
+            assert changed.intersection(range(start, stop))
+            written.update(range(start, stop))
+        assert changed <= written
+        assert len(written) <= len(changed) * (api.CNC_PARAMETERS_WRITE_GAP + 1)
+        assert server.parameters_descriptions.assigned == server.parameters.assigned
+        reads = -(-api.CNC_PARAMETERS_COUNT // api.CNC_PARAMETERS_CHUNK)
+        assert server.requests == reads + len(server.parameters.assigned)
+
+        # a restore of an unchanged system with a fresh mirror sends nothing
+        server.parameters.assigned.clear()
+        server.requests = 0
+        assert mirror.restore_parameters(path, max_age=60.0)
+        assert not server.parameters.assigned and server.requests == 0
+        print(f'{len(changed)} changed parameters, {reads} reads, {len(written)} written parameters: OK')
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+        client.close()
+        server.stop()
+
+def test_cache_invalidation_on_set():
+    log_command('TEST: CACHE INVALIDATION ON SET')
+    server = StandInServer().start()
+    client = connect(api.CncAPIClientCore(), server)
+    client.enable_cache()
+
+    def requests_of(call) -> int:
+        requests = server.requests
+        call()
+        return server.requests - requests
+
+    for name, get, set_request in [
+        ('set_wcs_info', client.get_coordinate_systems_info, lambda: client.set_wcs_info(1, [1.0, None, None, None, None, None])),
+        ('set_program_position_x', client.get_coordinate_systems_info, lambda: client.set_program_position_x(1.0)),
+        ('set_program_position_c', client.get_coordinate_systems_info, lambda: client.set_program_position_c(1.0)),
+        ('cnc_mdi_command', client.get_coordinate_systems_info, lambda: client.cnc_mdi_command('G10 L2 P1 X0')),
+        ('set_localization', client.get_localization_info, lambda: client.set_localization(locale_name='it-IT')),
+    ]:
+        assert get().has_data
+        assert requests_of(get) == 0
+        assert set_request()
+        assert requests_of(get) == 1
+        assert requests_of(get) == 0
+        print(f'{name}: OK')
+
+    # evaluated requests always reach the server, so their replayed responses match them
+    assert requests_of(lambda: client.send_many([client.get_system_info, client.get_system_info])) == 2
+    assert requests_of(client.get_system_info) == 0
+    client.close()
+    server.stop()
+
+def test_comparer_type_strictness():
+    log_command('TEST: COMPARER TYPE STRICTNESS')
+    res = RESPONSES['cnc.info']
+    a = api._decode_cnc_info(api.APICncInfo(), res)
+    b = api._decode_cnc_info(api.APICncInfo(), res)
+    assert a.is_equal(b) and a.digest() == b.digest()
+    for value in (float(a.units_mode), bool(a.units_mode)):
+        b.units_mode = value
+        assert not a.is_equal(b)
+        assert not api.APIComparableMixin.are_equal(a, b)
+        assert api.APIComparableMixin.diff(a, b) == {'units_mode': value}
+    b.units_mode = a.units_mode
+    assert a.is_equal(b)
+
+    # lists compare the classes of their items too
+    assert api._equal_values([1, 2.0], [1, 2.0])
+    assert not api._equal_values([1, 2], [1, 2.0])
+    assert not api._equal_values([[1]], [[True]])
+    assert not api._equal_values({'a': 1}, {'a': 1.0})
+
+    # an update decoder reports a value of another class as changed, once
+    changed = []
+    api._update_cnc_info(a, dict(res, **{'units.mode': float(res['units.mode'])}), changed)
+    assert changed == ['units_mode'] and a.units_mode.__class__ is float
+    print('OK')
+
+#
+# == END: tests
+
+if __name__ == '__main__':
+    test_framed_reads_split_across_recv_into()
+    test_send_many_ordering()
+    test_async_upload_with_generator_source()
+    test_cold_restore_parameters_sends_only_diffs()
+    test_cache_invalidation_on_set()
+    test_comparer_type_strictness()